@@ -30,20 +30,53 @@ known covariates (known_cov), observed covariates (observed_cov), and static cov
 
 """
 
+import contextlib
 from copy import deepcopy
+import functools
+import gzip
 import math
+import numbers
 import pickle
 from typing import Any, Callable, List, Optional, Sequence, Tuple, Union, Dict
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
 from paddlets.logger import Logger, raise_if_not, raise_if, raise_log
 
 logger = Logger(__name__)
 
 
+#Leading bytes of the files written by the supported compressions of `TSDataset.save`
+_COMPRESSION_MAGIC = {"gzip": b"\x1f\x8b", "lz4": b"\x04\x22\x4d\x18"}
+
+
+def _open_compressed(file: str, mode: str, compression: Optional[str] = None):
+    """
+    Open a file, compressed with the specified compression
+
+    Args:
+        file(str): file path
+        mode(str): `rb` or `wb`
+        compression(str|None): `gzip`, `lz4`, or None for an uncompressed file
+
+    Returns:
+        file object
+
+    Raise:
+        ImportError
+    """
+    if compression == "gzip":
+        return gzip.open(file, mode)
+    if compression == "lz4":
+        try:
+            import lz4.frame
+        except ImportError:
+            raise_log(ImportError("The lz4 compression requires the lz4 package, please install it first"))
+        return lz4.frame.open(file, mode)
+    return open(file, mode)
+
+
 class TimeSeries(object):
     """
     TimeSeries is the atomic data structure for representing target(s), observed covariates (observed_cov), and known covariates (known_cov). 
@@ -73,6 +106,33 @@ class TimeSeries(object):
                     ValueError(f"Invalid freq: {self._freq}")
                 )
 
+    @classmethod
+    def _from_trusted(
+        cls,
+        data: pd.DataFrame,
+        freq: Union[int, str],
+    ) -> "TimeSeries":
+        """
+        Construct a TimeSeries object from data which is known to be aligned to `freq`, skipping the `asfreq` round-trip.
+        Only for internal use, the index of `data` is expected to be a RangeIndex with step `freq`, 
+        or a DatetimeIndex whose freq is set to `freq`. A DatetimeIndex without a matching freq 
+        (e.g. a stepped slice, or a concatenation with gaps) goes through the regular constructor.
+
+        Args:
+            data(DataFrame): A Pandas DataFrame containing the time series data
+            freq(str|int):  A string or int representing the Pandas DateTimeIndex's frequency or RangeIndex's step size
+
+        Returns:
+            TimeSeries object
+
+        """
+        if isinstance(freq, str) and not (isinstance(data.index, pd.DatetimeIndex) and data.index.freq == freq):
+            return cls(data, freq)
+        ts = cls.__new__(cls)
+        ts._data = data
+        ts._freq = data.index.freqstr if isinstance(freq, str) else freq
+        return ts
+
     @classmethod
     def load_from_dataframe(
         cls, 
@@ -97,14 +157,18 @@ class TimeSeries(object):
 
         """
         #get data
+        #Selecting columns by a list or a mask already returns new data, so only a Series input needs an explicit copy.
+        #The selection is re-wrapped (no copy) to detach it from `data`, avoiding SettingWithCopyWarning on later updates.
         series_data = None
         if value_cols is None:
             if isinstance(data, pd.Series):
                 series_data = data.copy()
             else:
-                series_data = data.loc[:, data.columns != time_col].copy()
+                series_data = pd.DataFrame(data[[col for col in data.columns if col != time_col]], copy=False)
         else:
-            series_data = data.loc[:, value_cols].copy()
+            if isinstance(value_cols, str):
+                value_cols = [value_cols]
+            series_data = pd.DataFrame(data[value_cols], copy=False)
 
         if isinstance(series_data, pd.DataFrame):
             raise_if_not(
@@ -117,12 +181,18 @@ class TimeSeries(object):
                 time_col in data.columns,
                 f"The time column: {time_col} doesn't exist in the `data`!"
             )
-            time_col_vals = data.loc[:, time_col]
+            time_col_vals = data[time_col]
         else:
             time_col_vals = data.index
+        #Whether the data is known to be aligned to `freq`
+        freq_verified = False
+        time_col_arr = np.asarray(time_col_vals)
+        #A strictly increasing time column (the common case) can't have duplicates, 
+        #checking that is a single vectorized comparison instead of building a hash table
+        is_increasing = time_col_arr.dtype.kind in "iumM" and bool((time_col_arr[1:] > time_col_arr[:-1]).all())
         #Duplicated values or NaN are not allowed in the time column
         raise_if(
-            time_col_vals.duplicated().any(),
+            not is_increasing and time_col_vals.duplicated().any(),
             "duplicated values in the time column!"
         )
         #get time_index
@@ -134,10 +204,10 @@ class TimeSeries(object):
                     "The type of freq should be int when the type of time_col is RangeIndex")
             else:
                 freq = 1
-            start_idx, stop_idx = min(time_col_vals), max(time_col_vals) + freq
+            start_idx, stop_idx = int(time_col_arr.min()), int(time_col_arr.max()) + freq
             # All integers in the range must be present
             raise_if(
-                (stop_idx - start_idx)/freq != len(data),
+                stop_idx - start_idx != len(time_col_arr) * freq,
                 "The number of rows doesn't match with the RangeIndex!"
             )
             time_index = pd.RangeIndex(
@@ -145,6 +215,10 @@ class TimeSeries(object):
             )
         elif np.issubdtype(time_col_vals.dtype, np.object_) or \
             np.issubdtype(time_col_vals.dtype, np.datetime64):
+            if np.issubdtype(time_col_vals.dtype, np.object_):
+                #The values are known to be unique here, so the per-value cache of `to_datetime` can't pay off, 
+                #inferring the format once avoids the per-element dateutil parsing instead
+                time_col_vals = pd.to_datetime(time_col_vals, infer_datetime_format=True, cache=False)
             time_index = pd.DatetimeIndex(time_col_vals)
             if freq: 
                 #freq type needs to be string when time_col type is DatetimeIndex
@@ -153,8 +227,14 @@ class TimeSeries(object):
                     "The type of `freq` should be `str` when the type of `time_col` is `DatetimeIndex`."
                 )
             else:
+                if time_index.is_monotonic_increasing:
+                    #Infer the freq and attach it to the index at once, the data is then already aligned to it
+                    time_index = pd.DatetimeIndex(time_index, freq="infer")
+                    freq = time_index.freqstr
+                    freq_verified = freq is not None
+                else:
+                    freq = pd.infer_freq(time_index)
                 #If freq is not provided and automatic inference fail, throw exception
-                freq = pd.infer_freq(time_index)
                 raise_if(
                     freq is None,
                     "Failed to infer the `freq`. A valid `freq` is required."
@@ -164,7 +244,12 @@ class TimeSeries(object):
         if isinstance(series_data, pd.Series):
             series_data = series_data.to_frame()
         series_data.set_index(time_index, inplace=True)
-        series_data.sort_index(inplace=True)
+        #A RangeIndex is sorted by construction, and time columns are usually already in order, 
+        #so only sort when the linear monotonicity check fails
+        if not isinstance(time_index, pd.RangeIndex) and not time_index.is_monotonic_increasing:
+            series_data.sort_index(inplace=True)
+        if freq_verified:
+            return TimeSeries._from_trusted(series_data, freq)
         return TimeSeries(series_data, freq)
     
     @property
@@ -228,7 +313,24 @@ class TimeSeries(object):
             KeyError
 
         """
-        self._data = self._data.astype(dtype)
+        dtypes = self._data.dtypes
+        if isinstance(dtype, dict):
+            target_dtypes = dtype
+        else:
+            target_dtypes = {column: dtype for column in self._data.columns}
+        #Casting to object (e.g. str) converts the elements, so it is never treated as a no-op
+        to_cast = {
+            column: column_dtype for column, column_dtype in target_dtypes.items()
+            if dtypes[column] != pd.api.types.pandas_dtype(column_dtype) or dtypes[column] == np.object_
+        }
+        if not to_cast:
+            return
+        if len(to_cast) == len(self._data.columns) and \
+            len({pd.api.types.pandas_dtype(column_dtype) for column_dtype in to_cast.values()}) == 1:
+            #All the columns are cast to the same dtype, let pandas cast block by block instead of column by column
+            self._data = self._data.astype(next(iter(to_cast.values())))
+        else:
+            self._data = self._data.astype(to_cast)
 
     def to_dataframe(self, copy: bool=True) -> pd.DataFrame:
         """
@@ -290,6 +392,8 @@ class TimeSeries(object):
 
         """
         point_index = -1
+        time_index = self._data.index
+        length = len(time_index)
         if isinstance(point, str):
             point = pd.Timestamp(point)
         if isinstance(point, float):
@@ -297,30 +401,27 @@ class TimeSeries(object):
                 0.0 <= point <= 1.0,
                 "`point` (float) should be between 0.0 and 1.0."
             )
-            point_index = math.floor((self.data.shape[0] - 1) * point)
-        elif isinstance(point, (int, np.int64)):
+            point_index = math.floor((length - 1) * point)
+        elif isinstance(point, numbers.Integral):
             raise_if(
-                point not in range(self.data.shape[0]),
+                not 0 <= point < length,
                 "`point` (int) should be a valid index in series."
             )
             point_index = point
         elif isinstance(point, pd.Timestamp):
             raise_if_not(
-                isinstance(self.time_index, pd.DatetimeIndex),
+                isinstance(time_index, pd.DatetimeIndex),
                 "The provided `point` is of the Timestamp type, but the type of time column is not DatetimeIndex"
             )
             raise_if_not(
-                point >= self.start_time and point <= self.end_time,
+                time_index[0] <= point <= time_index[-1],
                 "The `point` is out of the valid range."
             )
-            if point in self.time_index:
-                point_index = self.time_index.get_loc(point)
+            #The time index is sorted, so a binary search covers both the hit and the miss case
+            if after:
+                point_index = int(time_index.searchsorted(point, side="left"))
             else:
-                point_index = self.time_index.get_loc(
-                    next(filter(lambda t: t >= point, self.time_index))
-                    if after
-                    else next(filter(lambda t: t <= point, self.time_index[::-1]))
-                )
+                point_index = int(time_index.searchsorted(point, side="right")) - 1
         else:
             raise_log(
                 TypeError(
@@ -332,7 +433,8 @@ class TimeSeries(object):
     def split(
         self, 
         split_point: Union[pd.Timestamp, str, float, int], 
-        after=True
+        after=True,
+        copy: bool = True
     ) -> Tuple["TimeSeries", "TimeSeries"]:
         """
         Split the TimeSeries object into two TimeSeries objects according to `split_point`
@@ -348,6 +450,8 @@ class TimeSeries(object):
 
                 If the data of the split_point exists, it will be included in the first TimeSeries object.
             after(bool): If `split_point` (pd.TimeSeries) doesn't exist in the time index, use the next valid index (True) or the previous one (False)
+            copy(bool): Copy the data of both parts (True) or let them share the data with the original TimeSeries object (False),
+                only use copy=False when neither part will be modified inplace
             
         Returns:
             Tuple["TimeSeries", "TimeSeries"]
@@ -358,20 +462,41 @@ class TimeSeries(object):
 
         """
         point = self.get_index_at_point(split_point, after)
-        shift = 0 if isinstance(split_point, (int, np.int64)) else 1
+        shift = 0 if isinstance(split_point, numbers.Integral) else 1
+        return self._split_at(point + shift, copy)
+
+    def _split_at(self, position: int, copy: bool = True) -> Tuple["TimeSeries", "TimeSeries"]:
+        """
+        Split the TimeSeries object into two TimeSeries objects before the row at `position`
+
+        Args:
+            position(int): The number of rows of the first TimeSeries object
+            copy(bool): Copy the data of both parts (True) or let them share the data with the original TimeSeries object (False)
+
+        Returns:
+            Tuple["TimeSeries", "TimeSeries"]
+        """
+        data, freq = self._data, self._freq
+        head, tail = data.iloc[:position, :], data.iloc[position:, ]
+        if copy:
+            head, tail = head.copy(), tail.copy()
         return (
-            TimeSeries(self.data.iloc[: point + shift, :], self.freq),
-            TimeSeries(self.data.iloc[point + shift :, ], self.freq)
+            TimeSeries._from_trusted(head, freq),
+            TimeSeries._from_trusted(tail, freq)
         )
     
-    def copy(self) -> "TimeSeries":
+    def copy(self, deep: bool = True) -> "TimeSeries":
         """
         Make a copy of the TimeSeries object
+
+        Args:
+            deep(bool): Copy the underlying data (True) or only the DataFrame object, 
+                sharing the data with the original TimeSeries object (False)
         
         Returns:
             TimeSeries
         """
-        return TimeSeries(self.data.copy(), self.freq)
+        return TimeSeries._from_trusted(self._data.copy(deep=deep), self._freq)
 
     def __getitem__(
             self,
@@ -400,16 +525,18 @@ class TimeSeries(object):
             ValueError
         
         """
+        data = self._data
         if isinstance(key, pd.DatetimeIndex):
-            raise_if_not(isinstance(self._data.index, pd.DatetimeIndex),
-                         f"The TimeSeries' index is of the type {type(self._data.index)}, but the key is of the type pd.DatetimeIndex")
-            return self.__class__(self._data.loc[key], freq=key.freqstr)
+            raise_if_not(isinstance(data.index, pd.DatetimeIndex),
+                         f"The TimeSeries' index is of the type {type(data.index)}, but the key is of the type pd.DatetimeIndex")
+            return self.__class__(data.loc[key], freq=key.freqstr)
         elif isinstance(key, pd.RangeIndex):
-            raise_if_not(isinstance(self._data.index, pd.RangeIndex),
-                         f"The TimeSeries' index is of the type {type(self._data.index)}, but the key is of the type pd.RangeIndex")
-            return self.__class__(self._data.loc[key], freq=key.step)
+            raise_if_not(isinstance(data.index, pd.RangeIndex),
+                         f"The TimeSeries' index is of the type {type(data.index)}, but the key is of the type pd.RangeIndex")
+            return self.__class__(data.loc[key], freq=key.step)
         elif isinstance(key, slice):
-            return self.__class__(self._data[key], freq=self.freq)
+            #The slice of a trusted series needs no asfreq, but it is copied so that it never shares data with self
+            return self.__class__._from_trusted(data[key].copy(), freq=self._freq)
 
         raise_log(ValueError(f"Invalid type of `key`: {type(key)}, currently only `pd.DatetimeIndex`, `pd.RangeIndex`, and `slice` are supported"))
         
@@ -432,24 +559,48 @@ class TimeSeries(object):
             ValueError
 
         """
-        raise_if_not(
-            len(set(i.freq for i in tss)) == 1,
+        raise_if(
+            len(tss) == 0 or any(ts.freq != tss[0].freq for ts in tss[1:]),
             f"Failed to concatenate, the freqs of TimeSeries objects are not consistent ." 
         )
         if axis == 0:
-            data = pd.concat([ts.data for ts in tss], axis=axis)
+            frames = [ts.data for ts in tss]
+            columns = frames[0].columns
+            dtypes = set(frames[0].dtypes)
+            dtype = next(iter(dtypes)) if len(dtypes) == 1 else None
+            values = None
+            if isinstance(dtype, np.dtype) and all(
+                frame.columns.equals(columns) and set(frame.dtypes) == dtypes for frame in frames[1:]
+            ):
+                values = [frame.to_numpy() for frame in frames]
+            if values is not None and all(value.dtype == dtype for value in values):
+                #Same columns with one numpy dtype: stack the values into a single block, 
+                #instead of letting pd.concat align and consolidate each frame
+                data = pd.DataFrame(
+                    np.concatenate(values, axis=0),
+                    index=frames[0].index.append([frame.index for frame in frames[1:]]),
+                    columns=columns,
+                    copy=False
+                )
+            else:
+                data = pd.concat(frames, axis=axis)
             raise_if(
                 data.index.duplicated().any(),
                 "Failed to concatenate, duplicated values found in the time column."
             )
-            return TimeSeries(data, tss[0].freq)
+            return TimeSeries._from_trusted(data, tss[0].freq)
         elif axis == 1:
+            #Check the column names before touching any data, stop at the first duplicate
+            seen_columns = set()
+            for ts in tss:
+                for column in ts.data.columns:
+                    raise_if(
+                        column in seen_columns,
+                        "Failed to concatenate, duplicated column names found."
+                    )
+                    seen_columns.add(column)
             data = pd.concat([ts.data for ts in tss], axis=axis)
-            raise_if(
-                data.columns.duplicated().any(),
-                "Failed to concatenate, duplicated column names found."
-            )
-            return TimeSeries(data, tss[0].freq)
+            return TimeSeries._from_trusted(data, tss[0].freq)
         else:
             raise_log(
                 ValueError(f"Failed to concatenate, invalid axis: {axis}")
@@ -553,20 +704,38 @@ class TSDataset(object):
         self._freq : Optional[str, int] = None
         self._check_data()
 
-        #Get built-in analysis operators
-        from paddlets.analysis import TSDataset_Inner_Analyzer
-        self._inner_analyzer = TSDataset_Inner_Analyzer
-
         if fill_missing_dates:
             #Fill the missing values
             from paddlets.transform import Fill
             fill_obj = Fill(
-                cols=list(self.columns.keys()), 
+                cols=list(self._column_types()), 
                 method=fillna_method,
                 window_size=fillna_window_size
             )
             fill_obj.fit_transform(self, inplace=True)
     
+    #Cached result of `columns`, along with the columns Index objects of the components it was built from
+    _columns_cache: Optional[Tuple[tuple, dict]] = None
+
+    #Cached result of `dtypes`, along with the columns and dtypes of the components it was built from
+    _dtypes_cache: Optional[Tuple[tuple, pd.Series]] = None
+
+    #Built-in analysis operators, imported on first use and shared by all TSDataset objects
+    _inner_analyzers: Optional[Dict[str, Callable]] = None
+
+    @property
+    def _inner_analyzer(self) -> Dict[str, Callable]:
+        """Get built-in analysis operators"""
+        if TSDataset._inner_analyzers is None:
+            from paddlets.analysis import TSDataset_Inner_Analyzer
+            #the first parameter of the operators needs to be TSDataset, so all of them are registered 
+            #as methods of the class at once, without shadowing any existing attribute
+            for name, operator in TSDataset_Inner_Analyzer.items():
+                if not hasattr(TSDataset, name):
+                    setattr(TSDataset, name, functools.partialmethod(operator))
+            TSDataset._inner_analyzers = TSDataset_Inner_Analyzer
+        return TSDataset._inner_analyzers
+
     def __getattr__(self, name: str) -> Callable:
         """
         Dynamically integrate and call built-in operators
@@ -582,47 +751,83 @@ class TSDataset(object):
             ValueError
 
         """
-        if (name.startswith('__') and name.endswith('__')) or \
-           (name.startswith('_') and name.endswith('_')) :
-            return super().__getattr__(name)
-        #analysis operators
-        if name in self._inner_analyzer:
-            #the first parameter of the self._inner_analyze operator needs to be TSDataset
-            #functools.partial can only provide the ability of default parameters, which is not flexible enough to use here
-            def partial(*arg, **kwargs):
-                return self._inner_analyzer[name](self, *arg, **kwargs)
-            return partial
-        else:
+        #Private and dunder names (e.g. `__setstate__`, `_repr_html_`) are never operators
+        if name[:1] == '_':
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        #analysis operators are methods of the class once they are loaded, 
+        #so only the first access before loading or an unknown name gets here
+        if name not in self._inner_analyzer:
             raise_log(
                 ValueError(f"attr: {name} doesn't exist!")
             )
+        return getattr(self, name)
+
+    #Whether `_check_data` is deferred to the end of a batch of updates, see `_suspend_checks`
+    _check_suspended: bool = False
+
+    @contextlib.contextmanager
+    def _suspend_checks(self):
+        """
+        Defer the consistency check of the TSDataset object while running a batch of updates (e.g. adding several columns),
+        the data is checked once when the batch finishes instead of after every single update.
+        A nested batch is checked by the outermost one, and no check is made when the batch raises.
+
+        Raise:
+            ValueError
+        """
+        if self._check_suspended:
+            yield
+            return
+        self._check_suspended = True
+        try:
+            yield
+        finally:
+            self._check_suspended = False
+        self._check_data()
 
     def _check_data(self):
-        freq_list = []
-        columns_list = []
-        if self._target is not None:
-            freq_list.append(self._target.freq)
-            columns_list += list(self._target.columns)
-        if self._observed_cov is not None:
-            freq_list.append(self._observed_cov.freq)
-            columns_list += list(self._observed_cov.columns)
-        if self._known_cov is not None:
-            freq_list.append(self._known_cov.freq)
-            columns_list += list(self._known_cov.columns)
-        if self._static_cov is not None:
-            columns_list += list(self._static_cov.keys())
+        if self._check_suspended:
+            return
+        freq_msg = "The freqs of target, observed_covariate, and known_covariate are not consistent."
+        columns_msg = "Duplicated column names in target, observed_covariate, and known_covariate."
+        #Single pass over the components, stop at the first inconsistency
+        series_list = [ts for ts in (self._target, self._observed_cov, self._known_cov) if ts is not None]
         #check freq
-        raise_if(
-            len(set(freq_list)) != 1,
-            "The freqs of target, observed_covariate, and known_covariate are not consistent."
-        )
-        self._freq = freq_list[0]
-        #check columns
+        raise_if(len(series_list) == 0, freq_msg)
+        freq = series_list[0].freq
+        seen_columns = set()
+        for ts in series_list:
+            raise_if(ts.freq != freq, freq_msg)
+            #check columns
+            for column in ts.columns:
+                raise_if(column in seen_columns, columns_msg)
+                seen_columns.add(column)
+        if self._static_cov is not None:
+            for column in self._static_cov:
+                raise_if(column in seen_columns, columns_msg)
+        self._freq = freq
+        self._columns_cache = None
+        self._dtypes_cache = None
+        self._share_time_index(series_list)
 
-        raise_if(
-            len(set(columns_list)) != len(columns_list),
-            "Duplicated column names in target, observed_covariate, and known_covariate."
-        )
+    @staticmethod
+    def _share_time_index(series_list: List[TimeSeries]):
+        """
+        Let the components whose time index equals the first one's share the same index object, 
+        which saves the duplicated index memory and turns later index alignment checks (e.g. in `pd.concat`) into identity checks.
+
+        Args:
+            series_list(List[TimeSeries]): The non-empty components of a TSDataset object
+
+        """
+        time_index = series_list[0].time_index
+        for ts in series_list[1:]:
+            other_index = ts.time_index
+            if other_index is time_index or other_index.name != time_index.name \
+                or getattr(other_index, "freq", None) != getattr(time_index, "freq", None):
+                continue
+            if other_index.equals(time_index):
+                ts.data.index = time_index
 
     @classmethod
     def load_from_csv(
@@ -760,10 +965,18 @@ class TSDataset(object):
                     static_cov_cols = [static_cov_cols]
                 for col in static_cov_cols:
                     raise_if(
-                        col not in df.columns or len(np.unique(df[col])) != 1,
+                        col not in df.columns,
+                        "static cov cals data is not in columns or schema is not right!"
+                    )
+                    #A single vectorized comparison against the first value, no sorting as in np.unique, 
+                    #missing values are treated as equal to each other as np.unique does
+                    col_vals = df[col].to_numpy()
+                    raise_if(
+                        len(col_vals) == 0 or \
+                            not ((col_vals == col_vals[0]) | (pd.isna(col_vals) & pd.isna(col_vals[0]))).all(),
                         "static cov cals data is not in columns or schema is not right!"
                     )
-                    static_cov[col] = df[col][0]
+                    static_cov[col] = col_vals[0]
         return cls(
             target, 
             observed_cov, 
@@ -785,12 +998,14 @@ class TSDataset(object):
             pd.DataFrame
 
         """
-        pd_list = []
-        if self._target is not None:
-            pd_list.append(self._target.to_dataframe(copy))
-        cov = self.get_all_cov()
-        if cov is not None:
-            pd_list.append(cov.to_dataframe(copy))
+        #Concatenate the components at once instead of merging the covariates first, 
+        #pd.concat already returns new data, so the components are not copied beforehand
+        pd_list = [
+            ts.data for ts in (self._target, self._observed_cov, self._known_cov) if ts is not None
+        ]
+        #A single frame is returned as a copy or a reference as requested, concatenating it would only copy it again
+        if len(pd_list) == 1:
+            return pd_list[0].copy() if copy else pd_list[0]
         return pd.concat(pd_list, axis=1)
 
     def to_numpy(self, copy: bool=True) -> np.ndarray:
@@ -807,6 +1022,15 @@ class TSDataset(object):
             np.ndarray
 
         """
+        frames = [ts.data for ts in (self._target, self._observed_cov, self._known_cov) if ts is not None]
+        index = frames[0].index
+        if len(frames) > 1 and all(len(set(frame.dtypes)) == 1 for frame in frames) and \
+            all(frame.index is index or frame.index.equals(index) for frame in frames[1:]):
+            #The values of a single-dtype DataFrame are a view of its block, 
+            #so stacking them directly skips building the concatenated DataFrame
+            arrays = [frame.to_numpy() for frame in frames]
+            if all(array.dtype == arrays[0].dtype for array in arrays[1:]):
+                return np.concatenate(arrays, axis=1)
         return self.to_dataframe(copy).to_numpy()
 
     def get_target(self) -> Optional["TimeSeries"]:
@@ -888,7 +1112,11 @@ class TSDataset(object):
         elif self._observed_cov is None:
             return self._known_cov
         else:
-            return TimeSeries(pd.concat([self._observed_cov.data, self._known_cov.data], axis=1), self._known_cov.freq)
+            #The components share one aligned time index (see `_check_data`), so the merged data is already aligned to freq
+            return TimeSeries._from_trusted(
+                pd.concat([self._observed_cov.data, self._known_cov.data], axis=1), 
+                self._known_cov.freq
+            )
 
     def set_target(self, target: "TimeSeries"):
         """
@@ -1053,12 +1281,34 @@ class TSDataset(object):
             "Failed to split, the TSDataset's target is None."
         )
         train_target, test_target = self._target.split(split_point, after)
-        time_point_split = train_target.end_time
-        train_post_cov, test_post_cov = self._observed_cov.split(time_point_split, after) \
-            if self._observed_cov else (None, None)
+        observed_cov = self._observed_cov
+        if not observed_cov:
+            train_post_cov, test_post_cov = None, None
+        elif observed_cov.time_index is self._target.time_index:
+            #observed_cov shares the time index of target (see `_check_data`), so it splits at the same row
+            train_post_cov, test_post_cov = observed_cov._split_at(len(train_target))
+        else:
+            #The rows up to the end time of train_target go to the first part, an int end time of 
+            #a RangeIndex is a time point as well, not a position as in `TimeSeries.split`
+            position = observed_cov.time_index.searchsorted(train_target.end_time, side='right')
+            train_post_cov, test_post_cov = observed_cov._split_at(int(position))
+        #known_cov and static_cov are not split, each part gets a shallow copy of them, 
+        #which shares the data but lets the parts add or drop columns independently
+        known_cov = self._known_cov
+        static_cov = self._static_cov
         return (
-            TSDataset(train_target, train_post_cov, self._known_cov, self._static_cov),
-            TSDataset(test_target, test_post_cov, self._known_cov, self._static_cov)
+            TSDataset(
+                train_target, 
+                train_post_cov, 
+                known_cov.copy(deep=False) if known_cov is not None else None, 
+                dict(static_cov) if static_cov is not None else None
+            ),
+            TSDataset(
+                test_target, 
+                test_post_cov, 
+                known_cov.copy(deep=False) if known_cov is not None else None, 
+                dict(static_cov) if static_cov is not None else None
+            )
         )
 
     def get_item_from_column(self, column: Union[str, int]) -> Union["TimeSeries", dict]:
@@ -1086,6 +1336,29 @@ class TSDataset(object):
         else:
             raise ValueError(f"column: {column} not exists!")
     
+    def _group_columns(self, columns: List[Union[str, int]]) -> Dict[str, List[Union[str, int]]]:
+        """
+        Group the specified columns by the component they belong to, keeping their order.
+        Every column is looked up once in the cached `columns` mapping, 
+        instead of scanning the columns of each component.
+
+        Args:
+            columns(List): column names
+
+        Returns:
+            Dict[str, List]: The key is the type (target, observed_cov, known_cov, or static_cov), and the value is the columns of that type
+        """
+        column_types = self._column_types()
+        static_cov = self._static_cov if self._static_cov else {}
+        groups = {'target': [], 'observed_cov': [], 'known_cov': [], 'static_cov': []}
+        for column in columns:
+            column_type = column_types.get(column)
+            if column_type is not None:
+                groups[column_type].append(column)
+            elif column in static_cov:
+                groups['static_cov'].append(column)
+        return groups
+
     def __getitem__(
         self,
         columns: Union[str, int, List[Union[str, int]]]
@@ -1109,52 +1382,70 @@ class TSDataset(object):
             len(set(columns)) == len(columns),
             "Duplicated values found in the columns"
         )
-        res = None
-        if self._target:
-            columns_in_target = [v for v in columns if v in self._target.columns]
-            if columns_in_target:
-                if len(columns_in_target) == 1:
-                    columns_in_target = columns_in_target[0]
-                res = pd.concat([res, self._target.data[columns_in_target]], axis=1) \
-                    if res is not None else self._target.data[columns_in_target]
-        if self._observed_cov:
-            columns_in_observed_cov = [v for v in columns if v in self._observed_cov.columns]
-            if columns_in_observed_cov:
-                if len(columns_in_observed_cov) == 1:
-                    columns_in_observed_cov = columns_in_observed_cov[0]
-                res = pd.concat([res, self._observed_cov.data[columns_in_observed_cov]], axis=1) \
-                    if res is not None else self._observed_cov.data[columns_in_observed_cov]
-        if self._known_cov:
-            columns_in_known_cov = [v for v in columns if v in self._known_cov.columns]
-            if columns_in_known_cov:
-                if len(columns_in_known_cov) == 1:
-                    columns_in_known_cov = columns_in_known_cov[0]
-                res = pd.concat([res, self._known_cov.data[columns_in_known_cov]], axis=1) \
-                    if res is not None else self._known_cov.data[columns_in_known_cov]
+        #Collect the selected data of every component, and concatenate them once at the end
+        groups = self._group_columns(columns)
+        pieces = []
+        count = 0
+        for ts, name in ((self._target, 'target'), (self._observed_cov, 'observed_cov'), (self._known_cov, 'known_cov')):
+            if ts:
+                columns_in_ts = groups[name]
+                if columns_in_ts:
+                    #A single column is returned as the Series of the underlying data, so that inplace updates take effect
+                    pieces.append(
+                        ts.data[columns_in_ts[0]] if len(columns_in_ts) == 1 else ts.data[columns_in_ts]
+                    )
+                    count += len(columns_in_ts)
         if self._static_cov:
-            columns_in_staitc_cov = [v for v in columns if v in self._static_cov]
-            if columns_in_staitc_cov:
-                for tmp in columns_in_staitc_cov:
-                    tmp_df = pd.Series(
-                        [self._static_cov[tmp] for i in range(len(self._target.data))],
+            columns_in_staitc_cov = groups['static_cov']
+            #A read-only stride-0 view of the scalar is enough when the values are materialized by the concat below, 
+            #while a static column selected on its own is returned writable
+            concatenated = len(pieces) + len(columns_in_staitc_cov) > 1
+            for tmp in columns_in_staitc_cov:
+                if concatenated:
+                    values = np.broadcast_to(np.asarray(self._static_cov[tmp]), len(self._target.data))
+                else:
+                    values = np.full(len(self._target.data), self._static_cov[tmp])
+                pieces.append(
+                    pd.Series(
+                        values,
                         index=self._target.time_index,
                         name=tmp
                     )
-                    res = pd.concat([res, tmp_df], axis=1) \
-                    if res is not None else tmp_df
-        
-        count = 0
-        if res is not None:
-            count = res.shape[1] if isinstance(res, pd.DataFrame) else 1
+                )
+            count += len(columns_in_staitc_cov)
+
         raise_if_not(
             count == len(columns),
             "The specified columns don't exist!"
         )
-        if isinstance(res, pd.DataFrame):
-            return res[columns]
-        else:
-            return res
+        if len(pieces) == 1:
+            #The columns of a single piece are already in the requested order
+            return pieces[0]
+        res = pd.concat(pieces, axis=1)
+        if list(res.columns) != list(columns):
+            res = res[columns]
+        return res
     
+    @staticmethod
+    def _align_to_index(value: pd.Series, index: pd.Index) -> pd.Series:
+        """
+        Align a Series to the time index of a component, reindexing it only when its index differs
+
+        Args:
+            value(pd.Series): New column values
+            index(pd.Index): The time index to align to
+
+        Returns:
+            pd.Series
+        """
+        #The values usually come from the same TSDataset, so the index is mostly the same object or at least equal
+        if value.index is index or value.index.equals(index):
+            return value
+        return value.reindex(index)
+
+    #The attribute of the component that a new column of each type is added to by `set_column`
+    _COLUMN_COMPONENTS = {'target': '_target', 'known_cov': '_known_cov', 'observed_cov': '_observed_cov'}
+
     def set_column(
         self,
         column: Union[str, int],
@@ -1182,43 +1473,7 @@ class TSDataset(object):
             attr = self.get_item_from_column(column)
         except ValueError:
             #If the column doesn't exist, then add a new column
-            if type == 'target':
-                raise_if_not(
-                    isinstance(value, pd.Series),
-                    "New column added to the target should be pd.Series."
-                )
-                if self._target is not None:
-                    self._target.data[column] = value.reindex(self._target.time_index)
-                else:
-                    self._target = TimeSeries.load_from_dataframe(pd.DataFrame(
-                        value.rename(column), 
-                        index=value.index
-                    ))
-            elif type == 'known_cov':
-                raise_if_not(
-                    isinstance(value, pd.Series),
-                    "New column added to the target should be pd.Series."
-                )
-                if self._known_cov is not None:
-                    self._known_cov.data[column] = value.reindex(self._known_cov.time_index)
-                else:
-                    self._known_cov = TimeSeries.load_from_dataframe(pd.DataFrame(
-                        value.rename(column), 
-                        index=value.index
-                    ))
-            elif type == 'observed_cov':
-                raise_if_not(
-                    isinstance(value, pd.Series),
-                    "New column added to the observed_cov should be pd.Series."
-                )
-                if self._observed_cov is not None:
-                    self._observed_cov.data[column] = value.reindex(self._observed_cov.time_index)
-                else:
-                    self._observed_cov = TimeSeries.load_from_dataframe(pd.DataFrame(
-                        value.rename(column), 
-                        index=value.index
-                    ))
-            elif type == 'static_cov':
+            if type == 'static_cov':
                 raise_if_not(
                     isinstance(value, int) or isinstance(value, str),
                     "New column added to the static_cov should be int or str"
@@ -1228,9 +1483,20 @@ class TSDataset(object):
                 else:
                     self._static_cov = {column: value}
             else:
-                raise_log(
-                    ValueError("Illegal type")
+                component = self._COLUMN_COMPONENTS.get(type)
+                raise_if(component is None, "Illegal type")
+                raise_if_not(
+                    isinstance(value, pd.Series),
+                    f"New column added to the {type} should be pd.Series."
                 )
+                ts = getattr(self, component)
+                if ts is not None:
+                    ts.data[column] = self._align_to_index(value, ts.time_index)
+                else:
+                    setattr(self, component, TimeSeries.load_from_dataframe(pd.DataFrame(
+                        value.rename(column), 
+                        index=value.index
+                    )))
             self._check_data()
             return
         #modify
@@ -1245,7 +1511,7 @@ class TSDataset(object):
                 isinstance(value, pd.Series),
                 "value is illegal!"
             )
-            attr.data[column] = value.reindex(attr.time_index)
+            attr.data[column] = self._align_to_index(value, attr.time_index)
     
     def __setitem__(
         self,
@@ -1275,11 +1541,12 @@ class TSDataset(object):
 
     def __str__(self):
         """str"""
-        return self.to_dataframe().__str__()
+        #Only read for rendering, no copy is needed
+        return self.to_dataframe(copy=False).__str__()
 
     def __repr__(self):
         """repr"""
-        return self.to_dataframe().__repr__()
+        return self.to_dataframe(copy=False).__repr__()
     
     def drop(
         self,
@@ -1304,31 +1571,20 @@ class TSDataset(object):
             len(set(columns)) == len(columns),
             "Duplicated column names found"
         )
-        if self._target is not None:
-            columns_in_target = [v for v in columns if v in self._target.columns]
-            if columns_in_target:
-                self._target.data.drop(columns_in_target, axis=1, inplace=True)
-                if self._target.data.shape[1] == 0:
-                    self._target = None
-        if self._observed_cov is not None:
-            columns_in_observed_cov = [v for v in columns if v in self._observed_cov.columns]
-            if columns_in_observed_cov:
-                self._observed_cov.data.drop(columns_in_observed_cov, axis=1, inplace=True)
-                if self._observed_cov.data.shape[1] == 0:
-                    self._observed_cov = None
-        if self._known_cov is not None:
-            columns_in_known_cov = [v for v in columns if v in self._known_cov.columns]
-            if columns_in_known_cov:
-                self._known_cov.data.drop(columns_in_known_cov, axis=1, inplace=True)
-                if self._known_cov.data.shape[1] == 0:
-                    self._known_cov = None
-        if self._static_cov is not None:
-            columns_in_staitc_cov = [v for v in columns if v in self._static_cov]
-            if columns_in_staitc_cov:
-                for tmp in columns_in_staitc_cov:
-                    del self._static_cov[tmp]
-                if len(self._static_cov) == 0:
-                    self._static_cov = None
+        groups = self._group_columns(columns)
+        for column_type, component in self._COLUMN_COMPONENTS.items():
+            if groups[column_type]:
+                ts = getattr(self, component)
+                ts.data.drop(groups[column_type], axis=1, inplace=True)
+                #Remove the component when all its columns are dropped
+                if ts.data.shape[1] == 0:
+                    setattr(self, component, None)
+        if groups['static_cov']:
+            #Rebuild the dict once instead of deleting the keys one by one
+            columns_in_staitc_cov = frozenset(groups['static_cov'])
+            self._static_cov = {
+                key: value for key, value in self._static_cov.items() if key not in columns_in_staitc_cov
+            } or None
 
     def plot(self, 
              columns:Union[List[str], str] = None, 
@@ -1376,9 +1632,11 @@ class TSDataset(object):
         if "figsize" not in kwargs:
             kwargs["figsize"] = figsize
 
-        #plot self data
-        raise_if_not(set(columns) <= set(self.columns.keys()),
-            f"Columns {set(columns) - set(self.columns.keys())} do not exist in origin datasets!")
+        #plot self data, the requested columns are checked against every dataset, so build their set once
+        columns_set = frozenset(columns)
+        column_types = self._column_types()
+        raise_if_not(columns_set <= column_types.keys(),
+            f"Columns {columns_set - column_types.keys()} do not exist in origin datasets!")
         df = self.__getitem__(columns)
         plot = df.plot(**kwargs)
 
@@ -1388,8 +1646,9 @@ class TSDataset(object):
                 add_data = [add_data]
             col_len = len(columns)
             for ts in add_data:
-                raise_if_not(set(columns) <= set(ts.columns.keys()),
-                            f"Columns {set(columns) - set(ts.columns.keys())} do not exist in added datasets!")
+                column_types = ts._column_types()
+                raise_if_not(columns_set <= column_types.keys(),
+                            f"Columns {columns_set - column_types.keys()} do not exist in added datasets!")
 
                 if ts.freq != self.freq:
                     logger.warning("Add datas have different frequency with origin data!")
@@ -1401,54 +1660,69 @@ class TSDataset(object):
             if labels:
                 if isinstance(labels, str):
                     labels = [labels]
-                custome_labels = labels
-                labels = origin_labels
-                raise_if(len(custome_labels) != len(add_data), f"Custom labels does not match added datasets num:{len(add_data)}")
-                count = 1
-                while count <= len(add_data):
-                    for i in range(col_len * count, col_len * (count + 1)):
-                        labels[i] = custome_labels[count - 1] + "-" + labels[i]
-                    count = count + 1  
+                raise_if(len(labels) != len(add_data), f"Custom labels does not match added datasets num:{len(add_data)}")
+                prefixes = labels
             else:
-                labels = origin_labels        
-                count = 1
-                while count <= len(add_data):
-                    for i in range(col_len * count, col_len * (count + 1)):
-                        labels[i] = "Add" + str(count) + "-" + labels[i]
-                    count = count + 1       
+                prefixes = ["Add" + str(count) for count in range(1, len(add_data) + 1)]
+            #The labels of the origin data are kept, those of the i-th added dataset are prefixed with the i-th prefix
+            labels = origin_labels[:col_len] + [
+                prefix + "-" + label
+                for count, prefix in enumerate(prefixes, 1)
+                for label in origin_labels[col_len * count: col_len * (count + 1)]
+            ]
             plot.legend(labels)
             
         return plot
 
-    def copy(self) -> "TSDataset":
+    def copy(self, deep: bool = True) -> "TSDataset":
         """
         Make a copy of the TSDataset object
+
+        Args:
+            deep(bool): Copy the underlying data (True), or only the DataFrame objects of the components and 
+                the static_cov dict, sharing the data with the original TSDataset object (False).
+                Columns can be added to or dropped from a shallow copy without affecting the original TSDataset object, 
+                but inplace updates of the values are shared.
         
         Returns:
             TSDataset
         
         """
-        target = self._target.copy() if self._target else None
-        observed_cov = self._observed_cov.copy() if self._observed_cov else None
-        known_cov = self._known_cov.copy() if self._known_cov else None
-        static_cov = deepcopy(self._static_cov) if self._static_cov else None
+        target = self._target.copy(deep) if self._target else None
+        observed_cov = self._observed_cov.copy(deep) if self._observed_cov else None
+        known_cov = self._known_cov.copy(deep) if self._known_cov else None
+        static_cov = None
+        if self._static_cov:
+            static_cov = deepcopy(self._static_cov) if deep else dict(self._static_cov)
         return TSDataset(target, observed_cov, known_cov, static_cov)
 
-    def save(self, file: str):
+    def save(self, file: str, compression: Optional[str] = None):
         """
         Save TSDataset object to a file
 
         Args:   
             file(str): file path
+            compression(str|None): Compress the file with `gzip`, or with `lz4` (requires the lz4 package), 
+                the default None saves it uncompressed. `load` detects the compression automatically.
+
+        Raise:
+            ValueError
+            ImportError
         
         """
-        with open(file, 'wb') as f:
-            pickle.dump(self, f)
+        raise_if(
+            compression is not None and compression not in _COMPRESSION_MAGIC,
+            f"Invalid compression: {compression}, only `gzip` and `lz4` are supported"
+        )
+        with _open_compressed(file, 'wb', compression) as f:
+            #Protocol 4 is readable by every supported python version (>=3.7), while protocol 5 (the highest one on 3.8+) 
+            #is not readable on 3.7 and is no faster without out-of-band buffers
+            pickle.dump(self, f, protocol=4)
 
     @classmethod
     def load(cls, file: str) -> "TSDataset":
         """
-        Load TSDataset from the saved file
+        Load TSDataset from the saved file, a compressed file is detected by its leading bytes
         
         Args:   
             file(str): file path
@@ -1458,6 +1732,12 @@ class TSDataset(object):
         
         """
         with open(file, 'rb') as f:
+            magic = f.read(4)
+        compression = None
+        for name, name_magic in _COMPRESSION_MAGIC.items():
+            if magic.startswith(name_magic):
+                compression = name
+        with _open_compressed(file, 'rb', compression) as f:
             return pickle.load(f)
     
     @property
@@ -1465,18 +1745,29 @@ class TSDataset(object):
         """return all columns(except static columns)
         
         Returns:
-            dict: The key is the column name, and the value is the type, including target, known_cov, and observed_cov
+            dict: The key is the column name, and the value is the type, including target, known_cov, and observed_cov.
         """
+        return dict(self._column_types())
+
+    def _column_types(self) -> dict:
+        """
+        Get the cached column name to type mapping behind `columns`, for internal read-only use.
+
+        Returns:
+            dict: The key is the column name, and the value is the type, including target, known_cov, and observed_cov.
+        """
+        #Any change to the columns of a component (setters, `set_column`, `drop`, or `data[col] = ...` from outside)
+        #replaces its columns Index object, so comparing the Index objects by identity tells whether the cache is stale
+        components = ((self._target, 'target'), (self._known_cov, 'known_cov'), (self._observed_cov, 'observed_cov'))
+        key = tuple(None if ts is None else ts.data.columns for ts, _ in components)
+        if self._columns_cache is not None and all(a is b for a, b in zip(self._columns_cache[0], key)):
+            return self._columns_cache[1]
         res = {}
-        if self._target is not None:
-            for column in self._target.columns:
-                res[column] = 'target'
-        if self._known_cov is not None:
-            for column in self._known_cov.columns:
-                res[column] = 'known_cov'
-        if self._observed_cov is not None:
-            for column in self._observed_cov.columns:
-                res[column] = 'observed_cov'
+        for ts, name in components:
+            if ts is not None:
+                for column in ts.columns:
+                    res[column] = name
+        self._columns_cache = (key, res)
         return res
     
     @property
@@ -1542,17 +1833,15 @@ class TSDataset(object):
         if isinstance(type, str):
             target_type = known_cov_type = observed_cov_type = type
         elif isinstance(type, dict):
+            #Group the columns by component, so that each component is cast at once
+            component_types = {'target': target_type, 'known_cov': known_cov_type, 'observed_cov': observed_cov_type}
+            column_types = self._column_types()
             for key, value in type.items():
                 raise_if_not(
-                    key in self.columns,
+                    key in column_types,
                     f"Invaild key: {key}"
                 )
-                if self.columns[key] == 'target':
-                    target_type[key] = value
-                elif self.columns[key] == 'known_cov':
-                    known_cov_type[key] = value
-                elif self.columns[key] == 'observed_cov':
-                    observed_cov_type[key] = value
+                component_types[column_types[key]][key] = value
         else:
             raise_log(
                 TypeError(f"Invaild type: {type}")
@@ -1572,14 +1861,17 @@ class TSDataset(object):
         Returns:
             pd.Series: <column name, dtype>
         """
-        type_list = []
-        if self._target is not None:
-            type_list.append(self._target.dtypes)
-        if self._known_cov is not None:
-            type_list.append(self._known_cov.dtypes)
-        if self._observed_cov is not None:
-            type_list.append(self._observed_cov.dtypes)
-        return pd.concat(type_list)
+        #The columns Index and the plain dtype tuple of each component identify the result, 
+        #comparing them is much cheaper than concatenating the per-component Series again
+        components = [ts for ts in (self._target, self._known_cov, self._observed_cov) if ts is not None]
+        key = tuple((ts.data.columns, tuple(ts.data.dtypes)) for ts in components)
+        cache = self._dtypes_cache
+        if cache is None or len(cache[0]) != len(key) or \
+            any(a is not c or b != d for (a, b), (c, d) in zip(cache[0], key)):
+            cache = (key, pd.concat([ts.dtypes for ts in components]))
+            self._dtypes_cache = cache
+        #The cached Series is never handed out, a copy of it is much cheaper than rebuilding it
+        return cache[1].copy()
 
     def sort_columns(self, ascending: bool = True):
         """
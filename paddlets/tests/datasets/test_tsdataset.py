@@ -1,5 +1,7 @@
 # !/usr/bin/env python3
 # -*- coding:utf-8 -*-
+import copy
+import importlib.util
 import pandas as pd
 import numpy as np
 
@@ -30,6 +32,7 @@ class TestTimeSeries(TestCase):
         )
         ts1 = TimeSeries.load_from_dataframe(data=sample1)
         self.assertEqual(ts1.freq, 'D')
+        self.assertEqual(ts1.time_index.freqstr, 'D')
         self.assertEqual(ts1.data.shape, (200, 2))
         #case2
         sample1 = pd.DataFrame(
@@ -81,6 +84,11 @@ class TestTimeSeries(TestCase):
         ts1 = TimeSeries.load_from_dataframe(data=sample1, value_cols=['a'], time_col='f', freq='12H')
         self.assertEqual(ts1.freq, '12H')
         self.assertEqual(ts1.data.shape, (399, 1))
+        #case7.1 non-ISO datetime strings
+        sample1['f'] = pd.date_range('2022-01-01', periods=200, freq='1H').strftime('%m/%d/%Y %H:%M')
+        ts1 = TimeSeries.load_from_dataframe(data=sample1, value_cols=['a'], time_col='f')
+        self.assertEqual(ts1.freq, 'H')
+        self.assertEqual(ts1.start_time, pd.Timestamp('2022-01-01 00:00:00'))
         #case8
         sample1 = pd.Series(
             np.random.randn(200), 
@@ -154,11 +162,16 @@ class TestTimeSeries(TestCase):
         self.assertEqual(ts1.get_index_at_point("2022-01-08"), 7)
         self.assertEqual(ts1.get_index_at_point("2022-01-08 12:45:23"), 8)
         self.assertEqual(ts1.get_index_at_point("2022-01-08 12:45:23", after=False), 7)
+        self.assertEqual(ts1.get_index_at_point("2022-01-08", after=False), 7)
+        self.assertEqual(ts1.get_index_at_point("2022-07-19"), 199)
         try:
             ts1.get_index_at_point('2021-01-08')
         except ValueError as e:
             self.assertEqual(str(e), 'The `point` is out of the valid range.')
         self.assertEqual(ts1.get_index_at_point(10), 10)
+        self.assertEqual(ts1.get_index_at_point(np.int32(10)), 10)
+        with self.assertRaises(ValueError):
+            ts1.get_index_at_point(-1)
         try:
             ts1.get_index_at_point(1000)
         except ValueError as e:
@@ -181,6 +194,15 @@ class TestTimeSeries(TestCase):
         self.assertEqual(ts2.data.shape, (8, 2))
         self.assertEqual(ts3.data.shape, (192, 2)) 
 
+        sample2 = pd.DataFrame(np.random.randn(200, 2), columns=['a', 'b'])
+        ts1 = TimeSeries.load_from_dataframe(data=sample2)
+        ts2, ts3 = ts1.split(100)
+        self.assertFalse(np.shares_memory(ts1.to_numpy(copy=False), ts2.to_numpy(copy=False)))
+        ts2, ts3 = ts1.split(100, copy=False)
+        self.assertEqual(ts2.data.shape, (100, 2))
+        self.assertEqual(ts3.data.shape, (100, 2))
+        self.assertTrue(np.shares_memory(ts1.to_numpy(copy=False), ts2.to_numpy(copy=False)))
+
     def test_copy(self):
         """
         unittest function
@@ -197,6 +219,11 @@ class TestTimeSeries(TestCase):
         ts2 = ts1.copy()
         self.assertTrue(id(ts1) != id(ts2))
         self.assertTrue(id(ts1.data) != id(ts2.data))
+        sample2 = pd.DataFrame(np.random.randn(200, 2), columns=['a', 'b'])
+        ts1 = TimeSeries.load_from_dataframe(data=sample2)
+        ts2 = ts1.copy(deep=False)
+        self.assertTrue(id(ts1.data) != id(ts2.data))
+        self.assertTrue(np.shares_memory(ts1.to_numpy(copy=False), ts2.to_numpy(copy=False)))
 
     def test_getitem(self):
         """
@@ -239,6 +266,20 @@ class TestTimeSeries(TestCase):
         res = ts1[10:150]
         assert len(res) == 140
         assert isinstance(res, TimeSeries)
+        assert res.freq == ts1.freq
+
+        # case4.1 stepped slice is realigned to the freq
+        res = ts1[10:20:2]
+        assert len(res) == 9
+        assert res.freq == ts1.freq
+        assert res.data.isnull().values.sum() == 8
+
+        # case4.2 slice returns a copy of the data
+        for ts in (ts1, ts2):
+            origin = ts.data.iloc[0, 0]
+            res = ts[0:5]
+            res.data.iloc[0, 0] = 99
+            assert ts.data.iloc[0, 0] == origin
 
         # case5 badcase
         with self.assertRaises(ValueError):
@@ -265,6 +306,16 @@ class TestTimeSeries(TestCase):
         self.assertEqual(ts3.data.shape, (200, 4))
         with self.assertRaises(ValueError):
             ts3 = TimeSeries.concat([ts1, ts2], axis=0)
+        with self.assertRaises(ValueError):
+            ts3 = TimeSeries.concat([ts1, ts2, ts1], axis=1)
+        sample3 = pd.DataFrame(
+            np.random.randn(100, 2), 
+            index=pd.date_range('2022-01-01', periods=100, freq='2D'),
+            columns=['f', 'g']
+        )
+        ts4 = TimeSeries.load_from_dataframe(data=sample3)
+        with self.assertRaises(ValueError):
+            ts3 = TimeSeries.concat([ts1, ts2, ts4], axis=1)
         #case2 test axis=0
         sample2 = pd.DataFrame(
             np.random.randn(200, 2), 
@@ -274,6 +325,13 @@ class TestTimeSeries(TestCase):
         ts2 = TimeSeries.load_from_dataframe(data=sample2)  
         ts3 = TimeSeries.concat([ts1, ts2]) #default axis=0
         self.assertEqual(ts3.data.shape, (400, 2))
+        self.assertTrue(ts3.data.equals(pd.concat([sample1, sample2])))
+        #mixed dtypes are preserved
+        sample4 = sample2.copy()
+        sample4['b'] = 1
+        ts5 = TimeSeries.concat([ts1, TimeSeries.load_from_dataframe(data=sample4)])
+        self.assertEqual(ts5.data.shape, (400, 2))
+        self.assertTrue(ts5.data.equals(pd.concat([sample1, sample4])))
         sample2 = pd.DataFrame(
             np.random.randn(200, 2), 
             index=pd.date_range('2022-07-30', periods=200, freq='1D'),
@@ -311,6 +369,12 @@ class TestTimeSeries(TestCase):
         self.assertEqual(ts2.data.dtypes['a'], 'float32')
         self.assertEqual(ts2.data.dtypes['b'], 'float64')
         self.assertEqual(ts2.data.dtypes['c'], 'float64')
+        #casting to the current dtype is a no-op
+        data = ts2.data
+        ts2.astype({'a': 'float32', 'b': 'float64'})
+        self.assertTrue(ts2.data is data)
+        with self.assertRaises(KeyError):
+            ts2.astype({'not_exists': 'float32'})
 
 
 class TestTSDataset(TestCase): 
@@ -352,6 +416,23 @@ class TestTSDataset(TestCase):
         self.assertEqual(tsdataset.get_observed_cov().data.shape, (200, 2))
         self.assertEqual(tsdataset.get_known_cov().data.shape, (200, 2))
         self.assertEqual(tsdataset.get_static_cov(), {'f': 1, 'g': 2})
+        #equal time indices are shared
+        self.assertTrue(tsdataset.get_target().time_index is tsdataset.get_observed_cov().time_index)
+        self.assertTrue(tsdataset.get_target().time_index is tsdataset.get_known_cov().time_index)
+        #case2 badcase, duplicated columns
+        with self.assertRaises(ValueError):
+            TSDataset(self.target, self.observed_cov, self.observed_cov)
+        with self.assertRaises(ValueError):
+            TSDataset(self.target, self.observed_cov, self.known_cov, {'a': 1})
+        #case3 badcase, inconsistent freqs
+        known_cov = TimeSeries.load_from_dataframe(
+            pd.Series(np.random.randn(100), index=pd.date_range('2022-01-01', periods=100, freq='2D'), name='k')
+        )
+        with self.assertRaises(ValueError):
+            TSDataset(self.target, self.observed_cov, known_cov)
+        #case4 badcase, empty
+        with self.assertRaises(ValueError):
+            TSDataset()
 
     def test_load_from_dataframe(self):
         """
@@ -379,6 +460,19 @@ class TestTSDataset(TestCase):
         self.assertEqual(tsdataset.get_observed_cov().data.shape, (200, 3))
         self.assertEqual(tsdataset.get_known_cov().data.shape, (200, 1))
         self.assertEqual(tsdataset.get_static_cov(), {'s': 1})
+        #case2.1 badcase, static cov column is not constant
+        sample1['s1'] = np.arange(200)
+        with self.assertRaises(ValueError):
+            TSDataset.load_from_dataframe(df=sample1, target_cols='a', static_cov_cols='s1')
+        sample1.drop(columns='s1', inplace=True)
+        #case2.2 static cov column only contains missing values
+        sample1['s1'] = np.nan
+        tsdataset = TSDataset.load_from_dataframe(df=sample1, target_cols='a', static_cov_cols='s1')
+        self.assertTrue(np.isnan(tsdataset.get_static_cov()['s1']))
+        sample1.loc[0, 's1'] = 1
+        with self.assertRaises(ValueError):
+            TSDataset.load_from_dataframe(df=sample1, target_cols='a', static_cov_cols='s1')
+        sample1.drop(columns='s1', inplace=True)
         #case3
         tmp = pd.Series(pd.date_range('2022-01-01', periods=200, freq='1D')).astype(str)
         sample1 = pd.DataFrame(np.random.randn(200, 3), columns=['a', 'c', 'd'])
@@ -475,6 +569,8 @@ class TestTSDataset(TestCase):
         self.assertEqual(tsdataset.get_observed_cov().data.shape, (200, 3))
         all_cov = tsdataset.get_all_cov()
         self.assertEqual(all_cov.data.shape, (200, 5))
+        self.assertEqual(all_cov.freq, tsdataset.freq)
+        self.assertEqual(all_cov.data.index.freq, all_cov.freq)
 
         df = tsdataset.to_dataframe()
         self.assertTrue(isinstance(df, pd.DataFrame))
@@ -482,6 +578,12 @@ class TestTSDataset(TestCase):
         ndarray = tsdataset.to_numpy()
         self.assertTrue(isinstance(ndarray, np.ndarray))
         self.assertEqual(ndarray.shape, (200, 6))
+        self.assertTrue(np.array_equal(ndarray, df.to_numpy()))
+        self.assertEqual(ndarray.dtype, df.to_numpy().dtype)
+        #single dtype components
+        tsdataset = TSDataset(self.target, self.known_cov)
+        self.assertTrue(np.array_equal(tsdataset.to_numpy(), tsdataset.to_dataframe().to_numpy()))
+        self.assertEqual(tsdataset.to_numpy().dtype, np.float64)
 
     def test_set_property(self):
         """
@@ -553,6 +655,31 @@ class TestTSDataset(TestCase):
         self.assertEqual(test.get_observed_cov().data.shape, (40, 2))
         self.assertEqual(test.get_known_cov().data.shape, (200, 2))
         self.assertEqual(test.get_static_cov(), {'f': 1, 'g': 2})
+        #the columns of known_cov and static_cov can be changed independently
+        train.set_column('h', train['b1'], 'known_cov')
+        train.set_static_cov({'i': 3})
+        self.assertEqual(test.get_known_cov().data.shape, (200, 2))
+        self.assertEqual(test.get_static_cov(), {'f': 1, 'g': 2})
+        self.assertEqual(tsdataset.get_known_cov().data.shape, (200, 2))
+
+        #RangeIndex, observed_cov is split at the same row as target
+        sample = pd.DataFrame(np.random.randn(10, 3), columns=['a', 'b', 'c'])
+        tsdataset = TSDataset.load_from_dataframe(sample, target_cols='a', observed_cov_cols=['b', 'c'])
+        train, test = tsdataset.split(6)
+        self.assertEqual(train.get_target().data.shape, (6, 1))
+        self.assertEqual(train.get_observed_cov().data.shape, (6, 2))
+        self.assertEqual(test.get_target().data.shape, (4, 1))
+        self.assertEqual(test.get_observed_cov().data.shape, (4, 2))
+
+        #RangeIndex, observed_cov is longer than target and doesn't share its time index
+        target = TimeSeries.load_from_dataframe(pd.DataFrame(np.random.randn(10, 1), columns=['a']))
+        observed_cov = TimeSeries.load_from_dataframe(pd.DataFrame(np.random.randn(15, 2), columns=['b', 'c']))
+        tsdataset = TSDataset(target, observed_cov)
+        train, test = tsdataset.split(6)
+        self.assertEqual(train.get_target().data.shape, (6, 1))
+        self.assertEqual(train.get_observed_cov().data.shape, (6, 2))
+        self.assertEqual(test.get_target().data.shape, (4, 1))
+        self.assertEqual(test.get_observed_cov().data.shape, (9, 2))
 
     def test_copy(self):
         """
@@ -565,6 +692,14 @@ class TestTSDataset(TestCase):
         ts2 = ts1.copy()
         self.assertTrue(id(ts1) != id(ts2))
         self.assertTrue(id(ts1.get_target()) != id(ts2.get_target()))
+        self.assertFalse(np.shares_memory(ts1['a'].values, ts2['a'].values))
+        #shallow copy shares the data, but not the columns
+        ts2 = ts1.copy(deep=False)
+        self.assertTrue(np.shares_memory(ts1['a'].values, ts2['a'].values))
+        ts2.set_column('h', ts2['b1'], 'known_cov')
+        ts2.set_static_cov({'i': 3})
+        self.assertEqual(ts1.get_known_cov().data.shape, (200, 2))
+        self.assertEqual(ts1.get_static_cov(), {'f': 1, 'g': 2})
 
     def test_get_item(self):
         """
@@ -577,10 +712,15 @@ class TestTSDataset(TestCase):
         self.assertEqual(ts1.get_item_from_column('g'), ts1.get_static_cov())
 
         self.assertEqual(ts1['c'].shape, ts1.get_observed_cov().data['c'].shape)
+        self.assertTrue(np.shares_memory(ts1['c'].values, ts1.get_observed_cov().data['c'].values))
         self.assertEqual(list(ts1[['a', 'c', 'c1', 'g']].columns), ['a', 'c', 'c1', 'g'])
         self.assertEqual(list(ts1[['a', 'c1', 'c', 'g']].columns), ['a', 'c1', 'c', 'g'])
         self.assertEqual(list(ts1[['g', 'c1', 'c', 'a']].columns), ['g', 'c1', 'c', 'a'])
         self.assertEqual(ts1[['a', 'c', 'c1', 'g']].shape, (200, 4))
+        self.assertEqual(ts1['g'].tolist(), [2] * 200)
+        self.assertEqual(ts1['g'].dtype, np.int64)
+        self.assertTrue(ts1['g'].values.flags.writeable)
+        self.assertTrue(ts1[['g', 'a']].values.flags.writeable)
         error = None
         try:
             ts1['g1_not_exists'] 
@@ -601,6 +741,9 @@ class TestTSDataset(TestCase):
         self.assertEqual(ts1.get_known_cov(), None)
         ts1.drop('g')
         self.assertEqual(ts1.get_static_cov(), {'f': 1})
+        ts1.drop(['f', 'c'])
+        self.assertEqual(ts1.get_static_cov(), None)
+        self.assertEqual(ts1.get_observed_cov(), None)
 
     def test_set_column(self):
         """
@@ -649,6 +792,26 @@ class TestTSDataset(TestCase):
         )
         self.assertEqual(ts1.get_known_cov().data.shape, (200, 1))
 
+        #values are aligned to the time index
+        ts1 = TSDataset(target=TimeSeries.load_from_dataframe(sample1))
+        ts1.set_column('a', sample2[::-1])
+        self.assertTrue(ts1['a'].equals(sample2))
+        ts1.set_column('b', sample2[:100], 'target')
+        self.assertEqual(ts1['b'].isnull().sum(), 100)
+
+        #batch updates are checked once at the end
+        ts1 = TSDataset(target=TimeSeries.load_from_dataframe(sample1))
+        with ts1._suspend_checks():
+            ts1.set_column('c7', sample1, 'known_cov')
+            ts1.set_static_cov({'g': 1})
+        self.assertEqual(ts1.get_known_cov().data.shape, (200, 1))
+        with self.assertRaises(ValueError):
+            with ts1._suspend_checks():
+                ts1.set_column('c8', sample1, 'known_cov')
+                #the duplicated column is only detected when the batch finishes
+                ts1.set_static_cov({'c8': 1})
+        self.assertFalse(ts1._check_suspended)
+
     def test_mock_transfrom(self):
         """
         unittest function
@@ -675,7 +838,43 @@ class TestTSDataset(TestCase):
         ts1.save("/tmp/ts.tmp")
         ts2 = TSDataset.load("/tmp/ts.tmp")
         self.assertEqual(ts1.to_dataframe().shape, ts2.to_dataframe().shape)
+        #pickle protocol 4, readable on every supported python version
+        with open("/tmp/ts.tmp", "rb") as f:
+            self.assertEqual(f.read(2), b"\x80\x04")
+
+        #case2: compressed file
+        ts1.save("/tmp/ts.tmp", compression="gzip")
+        ts2 = TSDataset.load("/tmp/ts.tmp")
+        self.assertTrue(ts1.to_dataframe().equals(ts2.to_dataframe()))
+        with self.assertRaises(ValueError):
+            ts1.save("/tmp/ts.tmp", compression="zip")
+
+        #case3: cached built-in operators keep the object picklable and are bound to the accessing object
+        self.assertEqual(ts1.summary().shape, ts1.summary().shape)
+        self.assertNotIn("summary", ts1.__dict__)
+        ts3 = copy.copy(ts1)
+        self.assertIs(ts3.summary.__self__, ts3)
+        #all operators are registered together, not only the accessed ones
+        self.assertTrue(hasattr(TSDataset, "max"))
+        with self.assertRaises(ValueError):
+            ts1.not_an_operator
+        ts1.save("/tmp/ts.tmp")
+        ts2 = TSDataset.load("/tmp/ts.tmp")
+        self.assertEqual(ts1.summary().shape, ts2.summary().shape)
+        self.assertFalse(hasattr(ts2, "_repr_html_"))
     
+    @unittest.skipUnless(importlib.util.find_spec("lz4"), "lz4 is not installed")
+    def test_save_and_load_lz4(self):
+        """
+        unittest function
+        """
+        ts1 = TSDataset(self.target, self.observed_cov, self.known_cov, self.static_cov)
+        ts1.save("/tmp/ts.tmp", compression="lz4")
+        with open("/tmp/ts.tmp", "rb") as f:
+            self.assertEqual(f.read(4), b"\x04\x22\x4d\x18")
+        ts2 = TSDataset.load("/tmp/ts.tmp")
+        self.assertTrue(ts1.to_dataframe().equals(ts2.to_dataframe()))
+
     def test_property(self):
         """
         unittest function
@@ -683,13 +882,31 @@ class TestTSDataset(TestCase):
         ts1 = TSDataset(self.target, self.observed_cov, self.known_cov, self.static_cov)
         res = {'a':'target', 'b': 'observed_cov', 'c': 'observed_cov', 'b1': 'known_cov', 'c1': 'known_cov'}
         self.assertEqual(res, ts1.columns)
+        #changes to the returned dict do not leak into later calls
+        ts1.columns['e'] = 'target'
+        self.assertEqual(res, ts1.columns)
+        #the columns stay up to date when a component is changed from outside
+        ts1.observed_cov.data['d'] = 1.0
+        self.assertEqual({**res, 'd': 'observed_cov'}, ts1.columns)
+        ts1.drop('d')
+        self.assertEqual(res, ts1.columns)
 
         #test dtypes
         self.assertEqual(ts1.dtypes.shape, (5, ))
+        ts1.observed_cov.data['b'] = ts1.observed_cov.data['b'].astype(np.int32)
+        self.assertEqual(ts1.dtypes['b'], np.int32)
+        ts1.dtypes['b'] = np.float64
+        self.assertEqual(ts1.dtypes['b'], np.int32)
 
         self.assertEqual(repr(ts1.to_dataframe()), repr(ts1))
         self.assertEqual(str(ts1.to_dataframe()), str(ts1))
 
+        #test to_dataframe with a single component
+        ts2 = TSDataset(self.target)
+        self.assertIs(ts2.to_dataframe(copy=False), self.target.data)
+        self.assertIsNot(ts2.to_dataframe(), self.target.data)
+        self.assertTrue(ts2.to_dataframe().equals(self.target.data))
+
     def test_concat(self):
         """
         unittest function
@@ -723,6 +940,9 @@ class TestTSDataset(TestCase):
         )
         tsdataset3 = TSDataset.concat([tsdataset1, tsdataset2])
         self.assertEqual(tsdataset3.get_all_cov().data.shape, (400, 4))
+        self.assertTrue(tsdataset3.to_dataframe().equals(pd.concat([sample1, sample2])[['a', 'b', 'c', 'd', 'e']]))
+        self.assertEqual(tsdataset3.freq, tsdataset1.freq)
+        self.assertEqual(tsdataset3.get_target().data.index.freq, tsdataset1.get_target().data.index.freq)
         sample2 = pd.DataFrame(
             np.random.randn(200, 5), 
             index=pd.date_range('2022-06-20', periods=200, freq='1D'),
@@ -808,7 +1028,13 @@ class TestTSDataset(TestCase):
         train.plot(columns=["a","b"],add_data=test)
         
         #case6, Joint plot, by add_data, custom labels
-        train.plot(columns=["a","b"], add_data=test ,labels=["pred1"])
+        plot = train.plot(columns=["a","b"], add_data=test ,labels=["pred1"])
+        self.assertEqual([text.get_text() for text in plot.get_legend().get_texts()], ["a", "b", "pred1-a", "pred1-b"])
+        plot = train.plot(columns=["a","b"], add_data=[test, test])
+        self.assertEqual(
+            [text.get_text() for text in plot.get_legend().get_texts()], 
+            ["a", "b", "Add1-a", "Add1-b", "Add2-a", "Add2-b"]
+        )
 
         #case7 badcase, labels lens not match origin labels
         with self.assertRaises(ValueError):
@@ -843,6 +1069,12 @@ class TestTSDataset(TestCase):
         tsdataset2.astype({'a': 'float32'})
         self.assertEqual(tsdataset2.get_target().data.dtypes['a'], 'float32')
         self.assertEqual(tsdataset2.get_all_cov().data.dtypes['e'], 'float64')
+        tsdataset2 = tsdataset1.copy()
+        tsdataset2.astype({'b': 'float32', 'c': np.float32, 'd': 'int64', 'e': 'float16'})
+        self.assertEqual(tsdataset2.get_observed_cov().data.dtypes.tolist(), [np.float32, np.float32, np.int64])
+        self.assertEqual(tsdataset2.get_known_cov().data.dtypes['e'], 'float16')
+        with self.assertRaises(ValueError):
+            tsdataset2.astype({'s': 'float32'})
 
     def test_reindex(self):
         """
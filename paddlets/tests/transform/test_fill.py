@@ -211,6 +211,40 @@ class TestFill(TestCase):
         self.assertTrue(eo.get_observed_cov().data.equals(at.get_observed_cov().data))
         return
 
+    def test_transform_keep_dtype(self):
+        """
+        unittest function
+        """
+        print(sys.stderr, "test_transform_keep_dtype()...")
+        a = [1, np.nan, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, np.nan]
+        b = [1, np.nan, 3, 4, 5, 6, 7, 8, 9, 10, 11, np.nan, np.nan, 14, 15, 16]
+        fake_input = pd.DataFrame({'X': a, 'Y': b})
+        ts64 = TSDataset.load_from_dataframe(df=fake_input, known_cov_cols=['X'], observed_cov_cols=['Y'])
+        ts32 = TSDataset.load_from_dataframe(df=fake_input.astype('float32'), known_cov_cols=['X'], 
+                                                         observed_cov_cols=['Y'])
+        for method in ['max', 'min', 'mean', 'median']:
+            params = {'cols': ['X', 'Y'], 'method': method, 'window_size': 4}
+            expect = Fill(**params).transform(ts64)
+            at = Fill(**params).transform(ts32)
+            for col in ['X', 'Y']:
+                self.assertEqual(at[col].dtype, np.float32)
+                self.assertTrue(expect[col].astype('float32').equals(at[col]))
+
+    def test_transform_static_cov(self):
+        """
+        unittest function
+        """
+        print(sys.stderr, "test_transform_static_cov()...")
+        fake_input = pd.DataFrame({'X': [1, np.nan, 3, 4], 's': 1.0})
+        ts = TSDataset.load_from_dataframe(df=fake_input, target_cols='X', static_cov_cols='s')
+        for method in ['pre', 'max']:
+            ob = Fill(cols=['s'], method=method)
+            result = ob.fit_transform(ts)
+            self.assertEqual(result.get_static_cov(), {'s': 1.0})
+        ob = Fill(cols=['X', 's'], method='pre')
+        result = ob.fit_transform(ts)
+        self.assertEqual(result.get_target().data['X'].tolist(), [1.0, 1.0, 3.0, 4.0])
+
     def test_fit_transform(self):
         """
         unittest function
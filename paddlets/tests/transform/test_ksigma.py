@@ -149,5 +149,13 @@ class TestKSigma(TestCase):
         real_known_df = result.get_known_cov().data
         self.assertEqual(np.array(expect_known_df['Math']).tolist(), np.array(real_known_df['Math']).tolist())
 
+        #case5, a target column together with a static cov column
+        ts_df['s'] = 1.0
+        ts = TSDataset.load_from_dataframe(df=ts_df, target_cols='Math', known_cov_cols='Eng', static_cov_cols='s')
+        ob = KSigma(['Math', 's'])
+        result = ob.fit_transform(ts)
+        self.assertEqual(result.get_target().data['Math'].tolist(), [90.0, 80.0, 70.0, 80.0, 85.0])
+        self.assertEqual(result.get_static_cov(), {'s': 1.0})
+
 if __name__ == "__main__":
     unittest.main()
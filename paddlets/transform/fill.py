@@ -20,6 +20,43 @@ from paddlets.logger.logger import log_decorator
 
 logger = Logger(__name__)
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _fill_by_window(values: np.ndarray, method: str, window_size: int, min_num_non_missing_values: int):
+    """
+    Fill the missing values of a 1-D float array inplace, from left to right, with the statistic of the sliding window 
+    ending at each missing value. Values filled earlier are part of the windows of later missing values.
+
+    Args:
+        values(np.ndarray): 1-D float array to fill.
+        method(str): Statistic of the sliding window, one of max, min, mean and median.
+        window_size(int): Size of the sliding window.
+        min_num_non_missing_values(int): Minimum number of non-missing values in the sliding window, 
+            if less than the min_num_non_missing_values, the missing value will be kept.
+    """
+    for i in np.flatnonzero(np.isnan(values)):
+        window = values[max(0, i - window_size + 1): i + 1]
+        num_non_missing_values = window.size - np.count_nonzero(np.isnan(window))
+        if num_non_missing_values == 0 or num_non_missing_values < min_num_non_missing_values:
+            continue
+        if method == "max":
+            values[i] = np.nanmax(window)
+        elif method == "min":
+            values[i] = np.nanmin(window)
+        elif method == "mean":
+            values[i] = np.nanmean(window)
+        else:
+            values[i] = np.nanmedian(window)
+
+
+#Compile the kernel when numba is installed, the plain numpy version is used otherwise
+if numba is not None:
+    _fill_by_window = numba.njit(cache=True)(_fill_by_window)
+
 
 class Fill(BaseTransform):
     """
@@ -101,11 +138,12 @@ class Fill(BaseTransform):
             if self.method in all_method:
                     new_ts[col].fillna(method=all_method[self.method]['method'], 
                                         value=all_method[self.method]['value'], inplace=True)  
-            else:
-                roll_window = pd.Series.rolling(new_ts[col], window=self.window_size, \
-                                                min_periods=self.min_num_non_missing_values)
-                for index in lack_index:
-                    new_ts[col].loc[index]  = roll_window.__getattribute__(self.method)()[index]           
+            elif len(lack_index) > 0:
+                col_data = new_ts[col]
+                values = col_data.to_numpy(dtype=np.float64, copy=True)
+                _fill_by_window(values, self.method, self.window_size, self.min_num_non_missing_values)
+                new_ts.set_column(col, pd.Series(values.astype(col_data.dtype, copy=False), 
+                                                 index=col_data.index, name=col))
         return new_ts
 
     def fit_transform(self, dataset: TSDataset, inplace: bool=False) -> TSDataset:
@@ -134,15 +134,17 @@ class StatsTransform(BaseTransform):
                 for e in self._statistics:
                     self._map[e].append(cur_series[start: end].__getattr__(e)())
 
-            for e in self._statistics:
-                new_name = '%s_%s' % (col, e)
-                if new_ts.columns[col] == 'target':
-                    new_value = pd.Series(self._map[e])
-                    new_value.index = new_ts[col].index
-                    new_ts.set_column(new_name, new_value, 'observed_cov')
-                else:
-                    data_item[new_name] = self._map[e]
-                self._map[e].clear()
+            #The dataset is checked once after all the statistics of the column are added
+            with new_ts._suspend_checks():
+                for e in self._statistics:
+                    new_name = '%s_%s' % (col, e)
+                    if new_ts.columns[col] == 'target':
+                        new_value = pd.Series(self._map[e])
+                        new_value.index = new_ts[col].index
+                        new_ts.set_column(new_name, new_value, 'observed_cov')
+                    else:
+                        data_item[new_name] = self._map[e]
+                    self._map[e].clear()
 
         return new_ts
 
@@ -217,11 +217,12 @@ class TimeFeatureGenerator(BaseTransform):
             freq = new_ts.get_target().freq
             extend_time = pd.date_range(start=tf_kcov[time_col][-1], freq=freq, periods=self.extend_points + 1, closed='right', name=time_col).to_frame()
             tf_kcov = pd.concat([tf_kcov, extend_time])
-        #Generate time index feature content
-        for k in self.feature_cols:
-            v = tf_kcov[time_col].apply(lambda x: CAL_DATE_METHOD[k](x))
-            v.index = tf_kcov[time_col]
-            new_ts.set_column(k, v, 'known_cov')
+        #Generate time index feature content, the dataset is checked once after all the features are added
+        with new_ts._suspend_checks():
+            for k in self.feature_cols:
+                v = tf_kcov[time_col].apply(lambda x: CAL_DATE_METHOD[k](x))
+                v.index = tf_kcov[time_col]
+                new_ts.set_column(k, v, 'known_cov')
                 
         return new_ts
 